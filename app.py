@@ -5,9 +5,13 @@ This script initializes and runs the main GUI application
 using the AppGUI class defined in the gui.app_gui module.
 """
 
+from multiprocessing import freeze_support
+
 from gui.app_gui import AppGUI
 
 if __name__ == "__main__":
+    # needed by the joblib workers that lemmatize phrases in a PyInstaller build
+    freeze_support()
 
     app = AppGUI()
     app.run()
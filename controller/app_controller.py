@@ -2,15 +2,18 @@
 This module contains the application controller for handling various operations.
 """
 
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from queue import Queue
 from typing import List
 
 from core.clusterizer import (ClusterByEntity, ClusterByUserKeys,
                               ClusterUsingKMeans)
-from core.data_cleaner import RemoveDuplicates, RemoveTrashPhrase
 from core.data_loader import LoadDataAsText, LoadDataFromFile
+from core.pipeline import clean_and_partition
+
+# oldest log messages are dropped if the GUI falls this far behind
+LOG_QUEUE_MAXLEN = 10_000
 
 
 @dataclass
@@ -54,12 +57,12 @@ class Controller:
         self.my_keys = config.my_keys
         self.min_num_clusters = config.min_num_clusters
         self.max_num_clusters = config.max_num_clusters
-        self.log_queue = Queue()
+        self.log_queue = deque(maxlen=LOG_QUEUE_MAXLEN)
         self.clusters = None
 
     def log(self, message):
         """Put the message into logging queue."""
-        self.log_queue.put(message)
+        self.log_queue.append(message)
 
     def print_result(self):
         """Returns clusters as List."""
@@ -71,8 +74,7 @@ class Controller:
         including loading, cleaning, clustering, and saving.
         """
         data = self.__load_data()
-        data = self.__remove_duplicates(data)
-        data = self.__remove_trash(data)
+        data = self.__clean_data(data)
         clusters, data = self.__cluster_by_entity(data)
         clusters, data = self.__cluster_by_user_keys(clusters, data)
         self.__cluster_using_kmeans(data, clusters)
@@ -85,25 +87,16 @@ class Controller:
         self.log(f"Loaded {len(data)} phrases.")
         return data
 
-    def __remove_duplicates(self, data):
-        """Remove duplicate phrases and log the process."""
-        self.log("Cleaning data from phrases with duplicates...")
-        duplicate_cleaner = RemoveDuplicates(data)
-        unique_phrases, deleted_phrases = duplicate_cleaner.delete()
-        self.log(f"Was deleted: {len(deleted_phrases)} phrases.")
-        self.log(f"After deleting duplicates left {len(unique_phrases)} phrases.")
-        return unique_phrases
-
-    def __remove_trash(self, data):
-        """Remove phrases with trash words and log the process."""
-        self.log("Deleting phrases with trash words...")
-        trash_cleaner = RemoveTrashPhrase(data, self.trash_words or [])
-        phrases_without_trash, deleted_phrases = trash_cleaner.delete()
-        self.log(f"Was deleted: {len(deleted_phrases)} phrases.")
-        self.log(
-            f"After deleting trash words left {len(phrases_without_trash)} phrases."
+    def __clean_data(self, data):
+        """Remove duplicates and phrases with trash words in one pass and log the process."""
+        self.log("Cleaning data from duplicates and phrases with trash words...")
+        phrases, duplicate_phrases, trash_phrases = clean_and_partition(
+            data, self.trash_words or []
         )
-        return phrases_without_trash
+        self.log(f"Was deleted: {len(duplicate_phrases)} duplicate phrases.")
+        self.log(f"Was deleted: {len(trash_phrases)} phrases with trash words.")
+        self.log(f"After cleaning left {len(phrases)} phrases.")
+        return phrases
 
     def __cluster_by_entity(self, data):
         """Cluster phrases by named entities and log the process."""
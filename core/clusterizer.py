@@ -5,22 +5,133 @@ A module for clustering phrases using different approaches:
 - using BERT + KMeans.
 """
 
+import os
 import re
 import warnings
 from abc import ABC, abstractmethod
 from collections import Counter, defaultdict
 from itertools import chain
+from pathlib import Path
 from typing import Dict, List, Tuple
+import ahocorasick
 import numpy as np
 import spacy
+import torch
 from nltk.corpus import stopwords
 from sentence_transformers import SentenceTransformer
-from sklearn.cluster import KMeans
-
-stop_words = stopwords.words("english")
-nlp = spacy.load("en_core_web_trf")
+from sklearn.cluster import KMeans, MiniBatchKMeans
+
+try:  # optional ONNX Runtime backend for CPU-only machines
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from transformers import AutoTokenizer
+except ImportError:
+    ORTModelForFeatureExtraction = None
+
+stop_words = frozenset(stopwords.words("english"))
+_WORD_RE = re.compile(r"\b\w+\b")
+spacy.prefer_gpu()  # run transformer batches on GPU when available
+# Only NER is used for clustering, so keep just the transformer and ner components
+nlp = spacy.load(
+    "en_core_web_trf", disable=["tagger", "parser", "lemmatizer", "attribute_ruler"]
+)
 warnings.filterwarnings("ignore", category=FutureWarning)
 
+_SBERT_DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
+_SBERT_BATCH_SIZE = 128 if _SBERT_DEVICE == "cuda" else 64
+_SBERT_MODEL = None
+# Created with: optimum-cli export onnx --model sentence-transformers/all-MiniLM-L6-v2 onnx_minilm/
+_ONNX_MODEL_DIR = Path(__file__).resolve().parent.parent / "onnx_minilm"
+_ONNX_ENCODER = None
+
+
+def _get_sbert() -> SentenceTransformer:
+    """
+    Load the Sentence-BERT model on first call and reuse it afterwards.
+    On GPU the model runs in half precision, on CPU torch uses all cores.
+
+    Returns:
+        SentenceTransformer: The cached "all-MiniLM-L6-v2" model.
+    """
+    global _SBERT_MODEL  # pylint: disable=global-statement
+    if _SBERT_MODEL is None:
+        _SBERT_MODEL = SentenceTransformer("all-MiniLM-L6-v2", device=_SBERT_DEVICE)
+        if _SBERT_DEVICE == "cuda":
+            _SBERT_MODEL.half()
+        else:
+            torch.set_num_threads(os.cpu_count() or 1)
+    return _SBERT_MODEL
+
+
+def _get_onnx_encoder():
+    """
+    Load the exported ONNX model and its tokenizer on first call and reuse them afterwards.
+
+    Returns:
+        Tuple: The tokenizer and the ONNX Runtime feature-extraction model.
+    """
+    global _ONNX_ENCODER  # pylint: disable=global-statement
+    if _ONNX_ENCODER is None:
+        tokenizer = AutoTokenizer.from_pretrained(_ONNX_MODEL_DIR)
+        model = ORTModelForFeatureExtraction.from_pretrained(
+            _ONNX_MODEL_DIR, provider="CPUExecutionProvider"
+        )
+        _ONNX_ENCODER = (tokenizer, model)
+    return _ONNX_ENCODER
+
+
+def _encode_onnx(phrases: List[str], batch_size: int = 32) -> np.ndarray:
+    """
+    Encode phrases with the ONNX model: mean pooling over tokens, then L2 normalization.
+
+    Args:
+        phrases (List[str]): Phrases to encode.
+        batch_size (int): Number of phrases per session run.
+
+    Returns:
+        np.ndarray: Normalized embeddings, one row per phrase.
+    """
+    tokenizer, model = _get_onnx_encoder()
+    batches = []
+    for start in range(0, len(phrases), batch_size):
+        tokens = tokenizer(
+            phrases[start : start + batch_size],
+            padding=True,
+            truncation=True,
+            return_tensors="np",
+        )
+        token_embeddings = model(**tokens).last_hidden_state
+        mask = tokens["attention_mask"][..., None].astype(token_embeddings.dtype)
+        summed = (token_embeddings * mask).sum(axis=1)
+        batches.append(summed / np.clip(mask.sum(axis=1), 1e-9, None))
+    embeddings = np.vstack(batches)
+    return embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+
+def _encode(phrases: List[str]) -> np.ndarray:
+    """
+    Encode phrases into normalized embeddings.
+    Uses ONNX Runtime on CPU if the exported model is available, Sentence-BERT otherwise.
+
+    Args:
+        phrases (List[str]): Phrases to encode.
+
+    Returns:
+        np.ndarray: Normalized embeddings, one row per phrase.
+    """
+    if (
+        _SBERT_DEVICE == "cpu"
+        and ORTModelForFeatureExtraction is not None
+        and _ONNX_MODEL_DIR.is_dir()
+    ):
+        return _encode_onnx(phrases)
+    return _get_sbert().encode(
+        phrases,
+        batch_size=_SBERT_BATCH_SIZE,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False,
+    )
+
 
 class ClusterPhrase(ABC):
     """
@@ -97,11 +208,25 @@ class ClusterByEntity(ClusterPhrase):
 
         entity_cluster = defaultdict(list)
 
+        # Skip empty strings and run NER over all phrases in batches
+        phrases_to_parse = [phrase for phrase in self.phrases if phrase]
+
+        # Parse phrases sorted by length so each batch needs little padding,
+        # then put the docs back in the original phrase order
+        order = sorted(
+            range(len(phrases_to_parse)), key=lambda i: len(phrases_to_parse[i])
+        )
+        # Single process: every worker would load its own transformer copy and
+        # torch thread pool, and forking from the pipeline thread can deadlock
+        sorted_docs = nlp.pipe(
+            (phrases_to_parse[i] for i in order), batch_size=32, n_process=1
+        )
+        docs = [None] * len(order)
+        for i, doc in zip(order, sorted_docs):
+            docs[i] = doc
+
         # Create clusters using entity list
-        for phrase in self.phrases:
-            if not phrase:  # пропускаємо пусті строки
-                continue
-            doc = nlp(phrase)
+        for phrase, doc in zip(phrases_to_parse, docs):
             for ent in doc.ents:
                 if (
                     ent.label_ in self.entities
@@ -113,7 +238,7 @@ class ClusterByEntity(ClusterPhrase):
         filtered_entity_cluster = {
             key: value for key, value in entity_cluster.items() if 1 < len(value) < 40
         }
-        phrases_from_entity_clusters = list(
+        phrases_from_entity_clusters = set(
             chain.from_iterable(filtered_entity_cluster.values())
         )
 
@@ -125,16 +250,20 @@ class ClusterByEntity(ClusterPhrase):
         ]
 
         # Add phrases to clusters if they contain entity in text
+        cluster_members = {
+            entity: set(values) for entity, values in filtered_entity_cluster.items()
+        }
         for phrase in phrases_without_entities:
             for entity in filtered_entity_cluster.keys():
                 if (
                     entity.lower() in phrase.lower()
-                    and phrase not in filtered_entity_cluster[entity]
+                    and phrase not in cluster_members[entity]
                 ):
                     filtered_entity_cluster[entity].append(phrase)
+                    cluster_members[entity].add(phrase)
 
         # Final check: phrases not included in any cluster
-        phrases_from_entity_clusters = list(
+        phrases_from_entity_clusters = set(
             chain.from_iterable(filtered_entity_cluster.values())
         )
         phrases_without_cluster = [
@@ -203,12 +332,22 @@ class ClusterByUserKeys(ClusterPhrase):
         if not [word for word in self.my_keys if word.strip()]:
             return self.clusters, self.phrases
 
+        # Build one automaton for all keys instead of testing every key per phrase
+        automaton = ahocorasick.Automaton()
+        for key in self.my_keys:
+            if key.strip():
+                automaton.add_word(key.lower(), key)
+        automaton.make_automaton()
+
         for phrase in self.phrases:
-            for key in self.my_keys:
-                if key.lower() in phrase.lower():
-                    self.clusters.setdefault(key, []).append(phrase)
+            # dict.fromkeys keeps match order and drops repeated keys within a phrase
+            matched_keys = dict.fromkeys(
+                key for _, key in automaton.iter(phrase.lower())
+            )
+            for key in matched_keys:
+                self.clusters.setdefault(key, []).append(phrase)
 
-        phrases_clusters = list(chain.from_iterable(self.clusters.values()))
+        phrases_clusters = set(chain.from_iterable(self.clusters.values()))
         phrases_without_cluster = [
             item for item in self.phrases if item not in phrases_clusters
         ]
@@ -279,21 +418,40 @@ class ClusterUsingKMeans(ClusterPhrase):
         if not self.phrases:
             print("No phrases to cluster.")
             return self.clusters
-        # Download Bert model
-        model = SentenceTransformer("all-MiniLM-L6-v2")
-        # Transform phrases into embedding vectors using model
-        embeddings = model.encode(self.phrases)
-        # Find optimal k using elbow method
+        # Encode every distinct phrase once and map vectors back to all phrases
+        phrase_index = {}
+        inverse = [
+            phrase_index.setdefault(phrase, len(phrase_index))
+            for phrase in self.phrases
+        ]
+        # Transform phrases into embedding vectors using Bert model
+        # (normalized, so KMeans works in cosine geometry)
+        unique_embeddings = _encode(list(phrase_index))
+        # Keep a single float32 C-ordered array so sklearn does not copy it per fit
+        embeddings = np.ascontiguousarray(unique_embeddings[inverse], dtype=np.float32)
+        # Find optimal k using elbow method (cheap MiniBatchKMeans fits for the scan)
         inertias = []
         for k in range(self.min_clusters, self.max_clusters + 1):
-            kmeans = KMeans(n_clusters=k, random_state=None)
+            kmeans = MiniBatchKMeans(
+                n_clusters=k, batch_size=1024, n_init=3, random_state=0
+            )
             kmeans.fit(embeddings)
             inertias.append(kmeans.inertia_)
-        # Use gradient to determine the optimal number of clusters
-        gradient = np.gradient(inertias)
-        optimal_k = np.argmax(gradient) + self.min_clusters
+            # Stop the sweep once the inertia curve has flattened out
+            if (
+                len(inertias) > 1
+                and inertias[-2] > 0
+                and abs(inertias[-1] - inertias[-2]) / inertias[-2] < 1e-3
+            ):
+                break
+        # Use the largest second difference (the "knee") as the optimal number of clusters
+        if len(inertias) < 3:
+            optimal_k = self.min_clusters
+        else:
+            second_diffs = np.diff(inertias, n=2)
+            optimal_k = int(np.argmax(second_diffs)) + self.min_clusters + 1
 
-        kmeans = KMeans(n_clusters=optimal_k, random_state=None)
+        kmeans = KMeans(n_clusters=optimal_k, n_init=10, random_state=None)
         labels = kmeans.fit_predict(embeddings)
 
         clustered_phrases = defaultdict(list)
@@ -307,13 +465,14 @@ class ClusterUsingKMeans(ClusterPhrase):
             if label == -1:
                 continue
 
-            all_words = [
-                word
-                for phrase in phrases_in_cluster
-                for word in re.findall(r"\b\w+\b", phrase.lower())
-                if word not in stop_words
-            ]
-            top_words = [word for word, _ in Counter(all_words).most_common(3)]
+            word_counts = Counter()
+            for phrase in phrases_in_cluster:
+                word_counts.update(
+                    word
+                    for word in _WORD_RE.findall(phrase.lower())
+                    if word not in stop_words
+                )
+            top_words = [word for word, _ in word_counts.most_common(3)]
             cluster_names[label] = " / ".join(top_words)
 
         for label, phrases_in_cluster in clustered_phrases.items():
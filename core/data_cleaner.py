@@ -5,15 +5,82 @@ Module providing classes for cleaning phrases from datasets.
 - `RemoveTrashPhrase` removes phrases containing user-defined trash words.
 """
 
+import re
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
+from joblib import Parallel, delayed
 from nltk.corpus import stopwords
 from nltk.stem import WordNetLemmatizer
-from nltk.tokenize import word_tokenize
 
-stop_words = stopwords.words("english")
+stop_words = frozenset(stopwords.words("english"))
 lemmatizer = WordNetLemmatizer()
+# Below this size starting worker processes costs more than it saves
+_PARALLEL_MIN_PHRASES = 10_000
+
+
+@lru_cache(maxsize=100_000)
+def _lemma(word: str) -> str:
+    """
+    Lemmatize a single word, caching results since vocabulary repeats a lot.
+
+    Args:
+        word (str): Lowercased word to lemmatize.
+
+    Returns:
+        str: Lemmatized word.
+    """
+    return lemmatizer.lemmatize(word)
+
+
+def _lemmatize_phrase(phrase: str) -> str:
+    """
+    Normalize a phrase by lowercasing, removing stopwords, lemmatizing
+    and sorting the words, so that word order is ignored.
+
+    Args:
+        phrase (str): Phrase to normalize.
+
+    Returns:
+        str: Normalized phrase string.
+    """
+    words = re.findall(r"\w+", phrase.lower())
+    lemmatized_words = sorted(_lemma(word) for word in words if word not in stop_words)
+    return " ".join(lemmatized_words)
+
+
+def lemmatize_phrases(phrases: List[str]) -> List[str]:
+    """
+    Normalize every phrase (see `_lemmatize_phrase`), using worker processes for big lists.
+
+    Args:
+        phrases (List[str]): Phrases to normalize.
+
+    Returns:
+        List[str]: Normalized phrase strings in the same order.
+    """
+    if len(phrases) >= _PARALLEL_MIN_PHRASES:
+        return Parallel(n_jobs=-1, backend="loky")(
+            delayed(_lemmatize_phrase)(phrase) for phrase in phrases
+        )
+    return [_lemmatize_phrase(phrase) for phrase in phrases]
+
+
+def compile_trash_pattern(trash_words: List[str]) -> Optional[re.Pattern]:
+    """
+    Compile trash words into one regex alternation, so each phrase is scanned once.
+
+    Args:
+        trash_words (List[str]): Words to be treated as trash.
+
+    Returns:
+        re.Pattern or None: Compiled pattern, or None if no non-empty trash words given.
+    """
+    words = [word for word in trash_words if word.strip()]
+    if not words:
+        return None
+    return re.compile("|".join(re.escape(word) for word in words))
 
 
 class RemovePhrase(ABC):
@@ -47,24 +114,6 @@ class RemoveDuplicates(RemovePhrase):
     Removes duplicate phrases ignoring case, word order, stopwords, and lemmatization.
     """
 
-    def _lemmatize_phrase(self, phrase: str) -> str:
-        """
-        Normalize a phrase by lowercasing, removing stopwords, and lemmatizing.
-
-        Args:
-            phrase (str): Phrase to normalize.
-
-        Returns:
-            str: Normalized phrase string.
-        """
-        words = word_tokenize(phrase.lower())
-        lemmatized_words = [
-            lemmatizer.lemmatize(word)
-            for word in words
-            if word.isalnum() and word not in stop_words
-        ]
-        return " ".join(lemmatized_words)
-
     def delete(self) -> Tuple[List[str], List[str]]:
         """
         Remove duplicate phrases based on lemmatized and normalized form.
@@ -78,11 +127,8 @@ class RemoveDuplicates(RemovePhrase):
         seen = set()
         deleted_phrases = []
         print(f"[DEBUG] First 5 phrases for check: {self.phrases[:5]}")
-        for phrase in self.phrases:
-            sorted_phrase = " ".join(sorted(phrase.lower().split()))
-            lemmatized = self._lemmatize_phrase(sorted_phrase)
-
-            if not any(lemmatized == seen_phrase for seen_phrase in seen):
+        for phrase, lemmatized in zip(self.phrases, lemmatize_phrases(self.phrases)):
+            if lemmatized not in seen:
                 unique_phrases.append(phrase)
                 seen.add(lemmatized)
             else:
@@ -116,13 +162,14 @@ class RemoveTrashPhrase(RemovePhrase):
               - List of phrases without trash words.
               - List of removed phrases containing trash words.
         """
-        if not [word for word in self.trash_words if word.strip()]:
+        pattern = compile_trash_pattern(self.trash_words)
+        if pattern is None:
             return self.phrases, []
 
         phrases_without_trash_words = []
         deleted_phrases = []
         for phrase in self.phrases:
-            if not any(word in phrase for word in self.trash_words):
+            if not pattern.search(phrase):
                 phrases_without_trash_words.append(phrase)
             else:
                 deleted_phrases.append(phrase)
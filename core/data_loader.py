@@ -48,7 +48,8 @@ class LoadData(ABC):
 
         try:
             if isinstance(self.data, pd.DataFrame):
-                return self.data.iloc[:, column].dropna().tolist()
+                values = self.data.iloc[:, column].dropna()
+                return values[values != ""].tolist()  # skip empty cells
             if isinstance(self.data, list):
                 return self.data
             print("[ERROR] Data format is not supported for conversion to list.")
@@ -84,7 +85,10 @@ class LoadDataFromFile(LoadData):
             Prints error messages for file not found or general exceptions.
         """
         try:
-            self.data = pd.read_csv(self.filepath)  # read file using pandas
+            # read only the keyword column as plain strings using pandas
+            self.data = pd.read_csv(
+                self.filepath, usecols=[0], dtype=str, engine="c", na_filter=False
+            )
             print(f"[INFO] Data is successfully loaded from file: {self.filepath}")
             return self.data  # return pandas data
         except FileNotFoundError:
@@ -0,0 +1,48 @@
+"""
+Module with fused data cleaning steps.
+
+- `clean_and_partition` removes duplicates and phrases with trash words
+  in a single pass over the phrases.
+"""
+
+from typing import List, Tuple
+
+from core.data_cleaner import compile_trash_pattern, lemmatize_phrases
+
+
+def clean_and_partition(
+    phrases: List[str], trash_words: List[str]
+) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Split phrases into kept phrases, duplicates and phrases with trash words.
+
+    Gives the same result as running `RemoveDuplicates` and then `RemoveTrashPhrase`,
+    but walks the phrase list only once.
+
+    Args:
+        phrases (List[str]): List of phrases to clean.
+        trash_words (List[str]): List of words to be treated as trash.
+
+    Returns:
+        Tuple[List[str], List[str], List[str]]: A tuple with:
+          - List of unique phrases without trash words.
+          - List of removed duplicate phrases.
+          - List of removed phrases containing trash words.
+    """
+    trash_pattern = compile_trash_pattern(trash_words)
+
+    kept_phrases = []
+    duplicate_phrases = []
+    trash_phrases = []
+    seen = set()
+    for phrase, lemmatized in zip(phrases, lemmatize_phrases(phrases)):
+        if lemmatized in seen:
+            duplicate_phrases.append(phrase)
+            continue
+        seen.add(lemmatized)
+        if trash_pattern is not None and trash_pattern.search(phrase):
+            trash_phrases.append(phrase)
+        else:
+            kept_phrases.append(phrase)
+
+    return kept_phrases, duplicate_phrases, trash_phrases
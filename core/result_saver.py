@@ -5,9 +5,11 @@ using a graphical file dialog (via tkinter). It supports exporting to .txt, .csv
 
 import json
 import tkinter as tk
+from itertools import chain
 from pathlib import Path
 from tkinter import filedialog
 
+import numpy as np
 import pandas as pd
 
 
@@ -53,18 +55,19 @@ class SaveData:
             path = Path(file_path)
 
             if path.suffix == ".txt":
+                parts = []
+                for name, items in self.data.items():
+                    parts.append(f"\n{name} ({len(items)} phrases):\n")
+                    parts.extend(f"  - {item}\n" for item in items)
                 with open(path, "w", encoding="utf-8") as f:
-                    for name, items in self.data.items():
-                        f.write(f"\n{name} ({len(items)} phrases):\n")
-                        for item in items:
-                            f.write(f"  - {item}\n")
+                    f.write("".join(parts))
 
             elif path.suffix == ".csv":
-                flat_list = []
-                for group, items in self.data.items():
-                    for item in items:
-                        flat_list.append({"Group": group, "Phrase": item})
-                df = pd.DataFrame(flat_list)
+                groups = np.repeat(
+                    list(self.data.keys()), [len(items) for items in self.data.values()]
+                )
+                phrases = list(chain.from_iterable(self.data.values()))
+                df = pd.DataFrame({"Group": groups, "Phrase": phrases})
                 df.to_csv(path, index=False, encoding="utf-8-sig")
 
             elif path.suffix == ".json":
@@ -4,8 +4,6 @@ Consists method run() to start main Tk().mainloop().
 """
 
 from gui.main_window.gui_main_window import MainWindow
-from gui.process_window.gui_process_window import ProcessWindow
-from gui.result_window.gui_result_window import ResultWindow
 
 
 class AppGUI:
@@ -38,36 +36,52 @@ class AppGUI:
 
     def run_process_window(self):
         """
-        Creates an instance of processing window and
-        shows the window.
+        Creates an instance of processing window on first call and
+        shows the window. Later calls clear and reuse the same window.
 
         Returns:
             instance of ProcessWindow class.
         """
-        self.process_window = ProcessWindow(
-            title="Process Window",
-            window_size="500x500",
-            row_weight=1,
-            column_weight=1,
-            theme_file="forest-dark.tcl",
-        )
-        self.process_window.show()
+        if self.process_window is None:
+            # pylint: disable=import-outside-toplevel
+            from gui.process_window.gui_process_window import ProcessWindow
+
+            self.process_window = ProcessWindow(
+                title="Process Window",
+                window_size="500x500",
+                row_weight=1,
+                column_weight=1,
+                theme_file="forest-dark.tcl",
+                master=self.main_window.window,
+            )
+            self.process_window.show()
+        else:
+            self.process_window.reset()
+            self.process_window.window.deiconify()
         return self.process_window
 
     def run_result_window(self):
         """
-        Creates an instance of resulting window and
-        shows the window.
+        Creates an instance of resulting window on first call and
+        shows the window. Later calls reuse the same window, which then
+        rewrites only the clusters that changed.
 
         Returns:
             instance of ResultWindow class.
         """
-        self.result_window = ResultWindow(
-            title="Result Window",
-            window_size="500x500",
-            row_weight=1,
-            column_weight=1,
-            theme_file="forest-dark.tcl",
-        )
-        self.result_window.show()
+        if self.result_window is None:
+            # pylint: disable=import-outside-toplevel
+            from gui.result_window.gui_result_window import ResultWindow
+
+            self.result_window = ResultWindow(
+                title="Result Window",
+                window_size="500x500",
+                row_weight=1,
+                column_weight=1,
+                theme_file="forest-dark.tcl",
+                master=self.main_window.window,
+            )
+            self.result_window.show()
+        else:
+            self.result_window.window.deiconify()
         return self.result_window
@@ -8,11 +8,47 @@ A module for base classes for creating:
 import tkinter as tk
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from itertools import chain
+from operator import methodcaller
 from tkinter import ttk
 from typing import Dict
 
 from gui.gui_style import StyleManager
 
+# Calls widget.get_value() for every input widget
+_get_value = methodcaller("get_value")
+
+
+# Tcl procedures that swap the placeholder inside the interpreter with one call per event
+PLACEHOLDER_PROCS = """
+namespace eval ::placeholder {
+    proc show {w first getargs trim text} {
+        set value [$w get {*}$getargs]
+        if {$trim} { set value [string trim $value] }
+        if {$value ne ""} { return 0 }
+        $w delete $first end
+        $w insert $first $text
+        $w configure -foreground gray
+        return 1
+    }
+    proc hide {w first getargs text} {
+        if {[$w get {*}$getargs] eq $text} { $w delete $first end }
+        $w configure -foreground black
+    }
+}
+"""
+
+
+def register_placeholder_procs(widget):
+    """
+    Define the placeholder Tcl procedures in the widget's interpreter, once per interpreter.
+
+    Args:
+        widget (tk.Widget): Any widget of the interpreter.
+    """
+    if not widget.tk.call("info", "commands", "::placeholder::show"):
+        widget.tk.eval(PLACEHOLDER_PROCS)
+
 
 @dataclass  # autogenerates __init__ and __repr__ (formal string representation) for parameters
 class WindowConfig:
@@ -157,20 +193,17 @@ class BaseButton:
             comboboxes (list, optional): List of combobox widgets.
             text (list, optional): List of text widgets.
         """
+        results = self.results
         if entries:
-            self.results["entries"] = [entry.get_value() for entry in entries]
+            results["entries"] = list(map(_get_value, entries))
         if checkbox_vars:
-            self.results["checkbuttons"] = [
-                checkbtn.get_value()
-                for checkbtns in checkbox_vars
-                for checkbtn in checkbtns
-            ]
+            results["checkbuttons"] = list(
+                map(_get_value, chain.from_iterable(checkbox_vars))
+            )
         if comboboxes:
-            self.results["comboboxes"] = [
-                combobox.get_value() for combobox in comboboxes
-            ]
+            results["comboboxes"] = list(map(_get_value, comboboxes))
         if text:
-            self.results["text"] = [t.get_value() for t in text]
+            results["text"] = list(map(_get_value, text))
 
 
 class BaseEntry:
@@ -192,6 +225,8 @@ class BaseEntry:
         self.parent = parent
         self.widget = ttk.Entry(parent)
         self.placeholder = placeholder
+        self._placeholder_active = False
+        register_placeholder_procs(self.widget)
         self._set_placeholder()
         self.widget.bind("<FocusIn>", self._clear_placeholder)
         self.widget.bind("<FocusOut>", self._set_placeholder)
@@ -201,19 +236,27 @@ class BaseEntry:
         The method to set placeholder within entry widget.
         """
         _ = event  # silence unused arg warning
-        if not self.widget.get():
-            self.widget.delete("0", "end")
-            self.widget.insert("0", self.placeholder)
-            self.widget.config(foreground="gray")
+        if self._placeholder_active or not self.placeholder:
+            return  # placeholder is already shown or there is nothing to show
+        # shows placeholder (gray) if the entry is empty
+        self._placeholder_active = bool(
+            self.widget.tk.call(
+                "::placeholder::show", self.widget, "0", "", 0, self.placeholder
+            )
+        )
 
     def _clear_placeholder(self, event=None):
         """
         The method to delete placeholder.
         """
         _ = event  # silence unused arg warning
-        if self.widget.get() == self.placeholder:
-            self.widget.delete("0", "end")
-            self.widget.config(foreground="black")
+        if not self._placeholder_active:
+            return  # placeholder is not shown, nothing to clear
+        # deletes only the placeholder itself, text inserted over it (e.g. pasted) stays
+        self.widget.tk.call(
+            "::placeholder::hide", self.widget, "0", "", self.placeholder
+        )
+        self._placeholder_active = False
 
     def get_value(self):
         """
@@ -246,36 +289,74 @@ class BaseText:
         self.parent = parent
         self.widget = tk.Text(parent, height=5)
         self.placeholder = placeholder
+        self._placeholder_active = False
+        self._has_focus = False
+        self._placeholder_update_pending = False
+        register_placeholder_procs(self.widget)
         self._set_placeholder()  # check if widget is symbols empty and put placeholder there
         self.widget.bind(
-            "<FocusIn>", self._clear_placeholder
+            "<FocusIn>", self._schedule_placeholder_update
         )  # if cursor in the widget
         self.widget.bind(
-            "<FocusOut>", self._set_placeholder
+            "<FocusOut>", self._schedule_placeholder_update
         )  # if cursor not in the widget
 
+    def _schedule_placeholder_update(self, event):
+        """
+        Remember the focus state and update the placeholder once Tk is idle,
+        so a burst of focus events results in at most one update.
+        """
+        self._has_focus = event.type == tk.EventType.FocusIn
+        if not self._placeholder_update_pending:
+            self._placeholder_update_pending = True
+            self.widget.after_idle(self._update_placeholder)
+
+    def _update_placeholder(self):
+        """
+        Show or hide the placeholder according to the latest focus state.
+        """
+        self._placeholder_update_pending = False
+        if self._has_focus:
+            self._clear_placeholder()
+        else:
+            self._set_placeholder()
+
     def _set_placeholder(self, event=None):
         """
         The method to set placeholder within text widget.
         """
         _ = event  # silence unused arg warning
-        if not self.widget.get(
-            "1.0", "end-1c"
-        ).strip():  # if widget is symbols empty (ignore spaces)
-            self.widget.delete("1.0", tk.END)  # delete all text in the widget
-            self.widget.insert("1.0", self.placeholder)  # insert placeholder
-            self.widget.config(foreground="gray")  # set font color to gray
+        if self._placeholder_active or not self.placeholder:
+            return  # placeholder is already shown or there is nothing to show
+        # if widget is symbols empty (ignore spaces) replace all text
+        # with gray placeholder
+        self._placeholder_active = bool(
+            self.widget.tk.call(
+                "::placeholder::show",
+                self.widget,
+                "1.0",
+                ("1.0", "end-1c"),
+                1,
+                self.placeholder,
+            )
+        )
 
     def _clear_placeholder(self, event=None):
         """
         The method to delete placeholder.
         """
         _ = event  # silence unused arg warning
-        if (
-            self.widget.get("1.0", "end-1c") == self.placeholder
-        ):  # if there is placeholder in widget
-            self.widget.delete("1.0", tk.END)  # delete all text in the widget
-            self.widget.config(foreground="black")  # set font color to black
+        if not self._placeholder_active:  # if there is no placeholder in widget
+            return
+        # delete the placeholder (but not text inserted over it) and set font color to black
+        self.widget.tk.call(
+            "::placeholder::hide",
+            self.widget,
+            "1.0",
+            ("1.0", "end-1c"),
+            self.placeholder,
+        )
+        self._placeholder_active = False
 
     def get_value(self):
         """
@@ -302,6 +383,7 @@ class BaseText:
         self.widget.delete("1.0", tk.END)
         self.widget.insert("1.0", text)
         self.widget.config(foreground="black")
+        self._placeholder_active = False
 
 
 class BaseCheckButton:
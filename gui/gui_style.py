@@ -3,7 +3,34 @@ A module for loading and applying Tkinter themes.
 """
 
 import os
-from tkinter import ttk
+from tkinter import font, ttk
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def get_fonts(widget):
+    """
+    Returns the named fonts used by the labels, creating them once per Tk root.
+    The fonts are kept on the root window, because a font belongs to the
+    interpreter it was created in.
+
+    Args:
+        widget (tk.Widget): Any widget of the application, needed to create the fonts.
+
+    Returns:
+        dict: Fonts by name: "title" (Arial 16 bold), "bold12" (Arial 12 bold)
+        and "text10" (Arial 10).
+    """
+    root = widget.nametowidget(".")
+    fonts = getattr(root, "label_fonts", None)
+    if fonts is None:
+        fonts = {
+            "title": font.Font(root=root, family="Arial", size=16, weight="bold"),
+            "bold12": font.Font(root=root, family="Arial", size=12, weight="bold"),
+            "text10": font.Font(root=root, family="Arial", size=10),
+        }
+        root.label_fonts = fonts
+    return fonts
 
 
 class StyleManager:
@@ -22,6 +49,8 @@ class StyleManager:
         """
         self.window = window
         self.theme_file = theme_file
+        self.theme_path = os.path.join(SCRIPT_DIR, theme_file)
+        self.style_name = os.path.splitext(os.path.basename(theme_file))[0]
         self.style = None
 
     def load_theme_path(self):
@@ -31,8 +60,7 @@ class StyleManager:
         Returns:
             str: The absolute path to the theme file.
         """
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        return os.path.join(script_dir, self.theme_file)
+        return self.theme_path
 
     def apply_theme(self, style_name):
         """
@@ -42,14 +70,19 @@ class StyleManager:
             style_name (str): The name of the theme to apply (must match the name in the .tcl file).
         """
 
-        self.style = ttk.Style(self.window)
-        self.style.theme_use(style_name)
+        if self.style is None:
+            self.style = ttk.Style(self.window)
+        # Switching theme restyles every widget of the interpreter, so skip it if active
+        if self.style.theme_use() != style_name:
+            self.style.theme_use(style_name)
 
     def activate_theme(self):
         """
-        Activates a theme: loads the theme file and applies it to the window.
+        Activates a theme: loads the theme file (if not loaded in this interpreter yet)
+        and applies it to the window.
         """
-        theme_path = self.load_theme_path()
-        self.window.tk.call("source", theme_path)
-        style_name = os.path.splitext(os.path.basename(self.theme_file))[0]
-        self.apply_theme(style_name)
+        self.style = ttk.Style(self.window)
+        # Windows sharing a Tcl interpreter share its themes, so source the file only once
+        if self.style_name not in self.style.theme_names():
+            self.window.tk.call("source", self.load_theme_path())
+        self.apply_theme(self.style_name)
@@ -5,11 +5,66 @@ positioned at the bottom of the main application window.
 """
 
 import threading
+from itertools import compress
 from tkinter import ttk
 
-from controller.app_controller import Controller, ControllerConfig
 from gui.base import BaseButton, BaseFrame
 
+# spaCy entity labels in the same order as the entity checkbuttons
+ENTITIES = (
+    "EVENT",
+    "FAC",
+    "GPE",
+    "LANGUAGE",
+    "LOC",
+    "MONEY",
+    "ORG",
+    "PERSON",
+    "PRODUCT",
+    "QUANTITY",
+    "WORK_OF_ART",
+)
+
+
+def _tokenize(text):
+    """
+    Split comma-separated user input into stripped, non-empty words.
+
+    Args:
+        text (str): Text from an entry widget.
+
+    Returns:
+        list: List of words.
+    """
+    return [word for word in map(str.strip, text.split(",")) if word]
+
+
+def _build_config(text, entries, checkbuttons, comboboxes):
+    """
+    Build a new ControllerConfig from saved user input.
+
+    Args:
+        text (list or str): Keyword lines from the text widget (empty string if none).
+        entries (list): Values of trash words, user keys and entity words entries.
+        checkbuttons (list): States of the entity checkbuttons.
+        comboboxes (list): Minimum and maximum number of clusters.
+
+    Returns:
+        ControllerConfig: Configuration for the clustering pipeline.
+    """
+    # pylint: disable=import-outside-toplevel
+    from controller.app_controller import ControllerConfig
+
+    return ControllerConfig(
+        row_data=list(text) if isinstance(text, list) else text,
+        trash_words=_tokenize(entries[0]),
+        entities=list(compress(ENTITIES, checkbuttons)),
+        stop_entity=_tokenize(entries[2]),
+        my_keys=_tokenize(entries[1]),
+        min_num_clusters=int(comboboxes[0]),
+        max_num_clusters=int(comboboxes[1]),
+    )
+
 
 class BottomFrame(BaseFrame):
     """
@@ -63,7 +118,7 @@ class BottomFrame(BaseFrame):
         """
         # Load data button
         btn_load_data = BaseButton(
-            self.frame, text="LOAD DATA", command=lambda: self.save_and_enable()
+            self.frame, text="LOAD DATA", command=self.save_and_enable
         )
         btn_load_data.widget.config(width=50)
         btn_load_data.widget.grid(
@@ -94,76 +149,76 @@ class BottomFrame(BaseFrame):
         """
         Start the clustering pipeline using a separate thread.
 
-        Collects input data from widgets, builds a ControllerConfig,
-        disables the cluster button, shows the process window, and
-        launches the pipeline with asynchronous thread monitoring.
+        Disables the cluster button, shows the process window, and launches
+        the pipeline in a background thread that builds the controller from the
+        saved input and reports back when done.
         """
-        entities = [
-            "EVENT",
-            "FAC",
-            "GPE",
-            "LANGUAGE",
-            "LOC",
-            "MONEY",
-            "ORG",
-            "PERSON",
-            "PRODUCT",
-            "QUANTITY",
-            "WORK_OF_ART",
-        ]
         # Get saved data by click on button Load Data
 
         input_data = self.widgets["btn_load_data"].results
 
         if input_data:
-            config = ControllerConfig(
-                row_data=input_data["text"][0],
-                trash_words=input_data["entries"][0].split(","),
-                entities=[
-                    entity
-                    for entity, selected in zip(entities, input_data["checkbuttons"])
-                    if selected
-                ],
-                stop_entity=input_data["entries"][2].split(","),
-                my_keys=input_data["entries"][1].split(","),
-                min_num_clusters=int(list(input_data["comboboxes"])[0]),
-                max_num_clusters=int(list(input_data["comboboxes"])[1]),
-            )
-            controller = Controller(config)
             # Button Clusterize is disable
             self.btn_cluster.widget.config(state="disabled")
 
             # Build ProcessWindow
             process_window = self.app_gui.run_process_window()
-            process_window.update_log_window(controller)
 
             # Run process in separete thread
-            def run_and_check():
+            def worker():
                 """
-                Run the clustering pipeline in a background thread and monitor it.
+                Build the controller and run the clustering pipeline in a background
+                thread, then hand the result back to the Tk main loop once it is
+                finished or failed.
                 """
-                thread = threading.Thread(target=controller.run_pipeline)
-                thread.start()
-                check_thread_completion(thread, controller)
-
-            def check_thread_completion(thread, controller):
-                """
-                Periodically check if the background thread has finished.
-
-                If finished, updates the GUI with the results.
-                """
-                if thread.is_alive():
-                    # wait for 200 ms
+                controller = None
+                failed = True
+                try:
+                    # Controller pulls in spaCy and the models, so import it
+                    # here to keep the slow first import off the Tk main loop
+                    # pylint: disable=import-outside-toplevel
+                    from controller.app_controller import Controller
+
+                    controller = Controller(
+                        _build_config(
+                            input_data["text"][0],
+                            input_data["entries"],
+                            input_data["checkbuttons"],
+                            input_data["comboboxes"],
+                        )
+                    )
                     self.btn_cluster.widget.after(
-                        200, check_thread_completion, thread, controller
+                        0, process_window.update_log_window, controller
                     )
-                else:
-                    # refresh window if thread finished
-                    # Build result window
-                    result_window = self.app_gui.run_result_window()
-                    result_window.update_result_window(controller)
+                    controller.run_pipeline()
+                    failed = False
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    if controller is None:
+                        print(f"[ERROR] Could not start clustering: {e}")
+                    else:
+                        # show the error in the process window instead of losing the thread
+                        controller.log(f"[ERROR] Clustering failed: {e}")
+                finally:
+                    self.btn_cluster.widget.after(0, on_done, controller, failed)
+
+            def on_done(controller, failed):
+                """
+                Build the result window with the clustering results.
 
-            run_and_check()
+                Args:
+                    controller (Controller or None): Controller of the run,
+                        None if it could not be created.
+                    failed (bool): True if the pipeline raised an error.
+                """
+                if failed:
+                    # let the user run the clustering again
+                    self.btn_cluster.widget.config(state="normal")
+                if controller is None:
+                    return
+                result_window = self.app_gui.run_result_window()
+                result_window.update_result_window(controller)
+
+            threading.Thread(target=worker, daemon=True).start()
 
         else:
             print("Data is not loaded.")
@@ -40,13 +40,12 @@ class MainWindow(BaseWindow):
         Configures row and column grid weight for layout management,
         and displays widgets in the window.
         """
+        # Tk accepts a list of indices, so columns/rows with equal weight share one call
         self.window.columnconfigure(0, weight=1)  # LeftFrame
-        self.window.columnconfigure(1, weight=2)  # RightFrame
-        self.window.columnconfigure(2, weight=2)  # RightFrame
+        self.window.columnconfigure((1, 2), weight=2)  # RightFrame
 
-        self.window.rowconfigure(0, weight=0)  # TopFrame
+        self.window.rowconfigure((0, 2), weight=0)  # TopFrame & BottomFrame
         self.window.rowconfigure(1, weight=1)  # RightFrame & LefFrame
-        self.window.rowconfigure(2, weight=0)  # BottomFrame
 
         frame_top = TopFrame(self.window)
         frame_top.build()
@@ -66,7 +65,7 @@ class MainWindow(BaseWindow):
                 frame_right.ent_entity_words,
             ],
             checkbox_vars=[frame_right.checkbox_vars],
-            comboboxes=[frame_right.combo_menu_min, frame_right.combo_menu_max],
+            comboboxes=frame_right.comboboxes,
             text=[self.frame_left.text],
         )
         self.frame_bottom.build()
@@ -3,11 +3,19 @@ This module defines the LeftFrame class for the GUI, which allows users to
 manually input keywords or upload them from a file.
 """
 
+import threading
 from tkinter import filedialog, ttk
 
 from core.data_loader import LoadDataFromFile
 from gui.base import BaseButton, BaseFrame, BaseText
 
+# File types offered in the open file dialog
+FILETYPES = (
+    ("Text files", "*.txt"),
+    ("Text files", "*.csv"),
+    ("All files", "*.*"),
+)
+
 
 class LeftFrame(BaseFrame):
     """
@@ -41,7 +49,7 @@ class LeftFrame(BaseFrame):
         and a button to upload keywords from a file.
         """
         # Text field to enter keywords
-        placeholder = "Enter \nyour keywords \nfor clustering \nhere..."
+        placeholder = "Enter your keywords for clustering here..."
         self.text = BaseText(self.frame, placeholder)
         self.text.widget.config(wrap="word", width=25)
         self.text.widget.grid(row=0, column=0, sticky="nsew", padx=(10, 0), pady=10)
@@ -52,36 +60,71 @@ class LeftFrame(BaseFrame):
         scrollbar.grid(row=0, column=1, sticky="ns", pady=10)
 
         # Load button
-        btn_cluster = BaseButton(
+        btn_load_file = BaseButton(
             self.frame,
             text="Download file",
-            command=lambda: self.load_file(),
+            command=self.load_file,
         )
-        btn_cluster.widget.config(width=20)
-        btn_cluster.widget.grid(row=1, column=0, pady=(20, 10), padx=40, sticky="s")
+        btn_load_file.widget.config(width=20)
+        btn_load_file.widget.grid(row=1, column=0, pady=(20, 10), padx=40, sticky="s")
+
+        self.widgets["btn_load_file"] = btn_load_file
 
     def load_file(self):
         """
         Open a file dialog to select a file and load keywords from it.
 
-        Loads the content and inserts it into the text input field.
+        The file is read in a background thread, so the window stays responsive,
+        and the content is inserted into the text input field when ready.
         """
         file_path = filedialog.askopenfilename(
             title="Виберіть файл",
-            filetypes=(
-                ("Text files", "*.txt"),
-                ("Text files", "*.csv"),
-                ("All files", "*.*"),
-            ),
+            filetypes=FILETYPES,
         )
         if file_path:
             print("You picked up:", file_path)
-        if file_path:
-            loader = LoadDataFromFile(file_path)
-            loader.load()
-            content = loader.to_list()
-            content = "\n".join(content) + "\n"
+            # Button is disabled until the file is loaded
+            self.widgets["btn_load_file"].widget.config(state="disabled")
+            threading.Thread(
+                target=self.read_file, args=(file_path,), daemon=True
+            ).start()
+
+    def read_file(self, file_path):
+        """
+        Read keywords from a file and pass them to the main thread.
+
+        Plain text files are inserted as is, CSV files are reduced to the keyword column.
+
+        Args:
+            file_path (str): Path to the selected file.
+        """
+        content = None
+        try:
+            if file_path.lower().endswith(".csv"):
+                # CSV needs parsing to take the keyword column only
+                loader = LoadDataFromFile(file_path)
+                loader.load()
+                content = "\n".join(loader.to_list()) + "\n"
+            else:
+                # Plain text already has one keyword per line
+                with open(file_path, "r", encoding="utf-8") as f:
+                    content = f.read()
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            # any failure must still reach the main thread to enable the button again
+            print(f"[ERROR] Error while reading file: {e}")
+            content = None
+        self.text.widget.after(0, self.show_file_content, content)
+
+    def show_file_content(self, content):
+        """
+        Insert loaded keywords into the text input field and enable the load button.
+
+        Args:
+            content (str or None): Keywords loaded from file, None if reading failed.
+        """
+        if content is not None:
             self.text.put_text_from_file(content)
+        self.widgets["btn_load_file"].widget.config(state="normal")
 
     def get_widgets(self):
         """Return a dictionary of widgets in the frame."""
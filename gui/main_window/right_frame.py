@@ -8,6 +8,28 @@ minimum and maximum number of clusters.
 from tkinter import ttk
 
 from gui.base import BaseCheckButton, BaseComboBox, BaseEntry, BaseFrame
+from gui.gui_style import get_fonts
+
+# Checkbutton labels
+CHECKBOX_LABELS = {
+    "EVENT": "Named events: wars, sports...",
+    "FAC": "Buildings, airports...",
+    "GPE": "Countries, cities...",
+    "LANGUAGE": "Named language.",
+    "LOC": "Non-GPE locations, mountain ranges...",
+    "MONEY": "Monetary values.",
+    "ORG": "Companies, agencies...",
+    "PERSON": "People, including fictional.",
+    "PRODUCT": "Objects, vehicles, foods...",
+    "QUANTITY": "Measurements: weights, distance...",
+}
+# (row, column, text) of every checkbutton: two columns of 5 rows
+CHECKBOX_LAYOUT = tuple(
+    (i % 5, i // 5, text) for i, text in enumerate(CHECKBOX_LABELS.values())
+)
+# Values for Comboboxes
+CLUSTER_VALUES_MIN = tuple(range(5, 15))
+CLUSTER_VALUES_MAX = tuple(range(16, 31))
 
 
 class RightFrame(BaseFrame):
@@ -32,17 +54,37 @@ class RightFrame(BaseFrame):
         self.ent_trash_words = None
         self.ent_my_keys = None
         self.ent_entity_words = None
+        # Filled in place by build_options(), so references handed out earlier stay valid
         self.checkbox_vars = []
+        self.comboboxes = []
         self.combo_menu_min = None
         self.combo_menu_max = None
+        self._options_built = False
 
     def build(self):
-        """Create and place all GUI elements inside the right frame."""
+        """
+        Create entry fields right away and the option widgets
+        (checkbuttons and comboboxes) once the frame is first shown.
+        """
+        self.build_entries()
+        self.frame.bind("<Map>", self._build_options_once)
+
+    def _build_options_once(self, event=None):
+        """Build the option widgets on the first <Map> event only."""
+        _ = event  # silence unused arg warning
+        if self._options_built:
+            return
+        self._options_built = True
+        self.build_options()
+
+    def build_entries(self):
+        """Create and place the label and entry fields inside the right frame."""
+        bold12 = get_fonts(self.frame)["bold12"]
         # Main Label for all Entry fields
         lbl_entry_names = ttk.Label(
             self.frame,
             text="Enter the words you want to include/exclude from the list.",
-            font=("Arial", 12, "bold"),
+            font=bold12,
         )
         lbl_entry_names.grid(row=0, column=0)
 
@@ -70,10 +112,13 @@ class RightFrame(BaseFrame):
             row=3, column=0, sticky="ew", padx=(20, 20), pady=(10, 10)
         )
 
+    def build_options(self):
+        """Create and place entity checkbuttons and cluster range comboboxes."""
+        bold12 = get_fonts(self.frame)["bold12"]
         # 4. CHECKBUTTON - Entity____________________________________________________
         # Label for checkbuttons
         lbl_checkbox_names = ttk.Label(
-            self.frame, text="Choose the entities:", font=("Arial", 12, "bold")
+            self.frame, text="Choose the entities:", font=bold12
         )
         lbl_checkbox_names.grid(row=4, column=0, sticky="w", padx=20, pady=(20, 5))
 
@@ -85,26 +130,9 @@ class RightFrame(BaseFrame):
         frame_checkbuttons.columnconfigure(2, weight=1)
         # frame_checkbuttons.rowconfigure(0, weight=1)
 
-        # Checkbutton labels
-        checkbox_labels = {
-            "EVENT": "Named events: wars, sports...",
-            "FAC": "Buildings, airports...",
-            "GPE": "Countries, cities...",
-            "LANGUAGE": "Named language.",
-            "LOC": "Non-GPE locations, mountain ranges...",
-            "MONEY": "Monetary values.",
-            "ORG": "Companies, agencies...",
-            "PERSON": "People, including fictional.",
-            "PRODUCT": "Objects, vehicles, foods...",
-            "QUANTITY": "Measurements: weights, distance...",
-        }
-
-        self.checkbox_vars = []
         # Checkbuttons
-        for i, name in enumerate(checkbox_labels.values()):
-            checkbtn = BaseCheckButton(frame_checkbuttons, text=f"{name}")
-            row = i % 5  # from 0 to 5
-            col = i // 5  # 0 or 1
+        for row, col, name in CHECKBOX_LAYOUT:
+            checkbtn = BaseCheckButton(frame_checkbuttons, text=name)
             checkbtn.widget.grid(row=row, column=col, sticky="w", pady=5, padx=20)
             self.checkbox_vars.append(checkbtn)
 
@@ -112,35 +140,33 @@ class RightFrame(BaseFrame):
 
         # Label for Combobox min_clusters
         lbl_min_clusters = ttk.Label(
-            frame_checkbuttons, text="min_clusters:", font=("Arial", 12, "bold")
+            frame_checkbuttons, text="min_clusters:", font=bold12
         )
         lbl_min_clusters.grid(row=0, column=2, sticky="we", padx=50, pady=5)
-        # List values for Combobox
-        cluster_values_min = list(range(5, 15))
         # Combobox min_clusters
         self.combo_menu_min = BaseComboBox(
             frame_checkbuttons,
-            values=cluster_values_min,
-            default_value=cluster_values_min.index(5),
+            values=CLUSTER_VALUES_MIN,
+            default_value=CLUSTER_VALUES_MIN.index(5),
         )
         self.combo_menu_min.widget.grid(row=1, column=2, sticky="we", padx=50, pady=5)
+        self.comboboxes.append(self.combo_menu_min)
 
         # 6. COMBOBOX - max_clusters____________________________________________________
 
         # Label for Combobox max_clusters
         lbl_max_clusters = ttk.Label(
-            frame_checkbuttons, text="max_clusters:", font=("Arial", 12, "bold")
+            frame_checkbuttons, text="max_clusters:", font=bold12
         )
         lbl_max_clusters.grid(row=2, column=2, sticky="we", padx=50, pady=5)
-        # List values for Combobox
-        cluster_values_max = list(range(16, 31))
         # Combobox max_clusters
         self.combo_menu_max = BaseComboBox(
             frame_checkbuttons,
-            values=cluster_values_max,
-            default_value=cluster_values_max.index(16),
+            values=CLUSTER_VALUES_MAX,
+            default_value=CLUSTER_VALUES_MAX.index(16),
         )
         self.combo_menu_max.widget.grid(row=3, column=2, sticky="we", padx=50, pady=5)
+        self.comboboxes.append(self.combo_menu_max)
 
     def get_widgets(self):
         """Return a dictionary of widgets in the frame."""
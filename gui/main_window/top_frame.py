@@ -6,6 +6,7 @@ It contains the main title and a subtitle to guide the user.
 from tkinter import ttk
 
 from gui.base import BaseFrame
+from gui.gui_style import get_fonts
 
 
 class TopFrame(BaseFrame):
@@ -34,11 +35,12 @@ class TopFrame(BaseFrame):
         Creates a main title and a subtitle, and places them using grid geometry.
         Stores the widgets in self.widgets for later access.
         """
+        fonts = get_fonts(self.frame)
         # Main title
         lbl_name = ttk.Label(
             self.frame,
             text="Are you ready to CLUSTER your KEYWORDS??",
-            font=("Arial", 16, "bold"),
+            font=fonts["title"],
         )
         lbl_name.grid(row=0, column=0, sticky="we", pady=(10, 5))
 
@@ -46,7 +48,7 @@ class TopFrame(BaseFrame):
         lbl_subname = ttk.Label(
             self.frame,
             text="to start working, please paste the key words in the left text field...",
-            font=("Arial", 10),
+            font=fonts["text10"],
         )
         lbl_subname.grid(row=1, column=0, sticky="w", padx=(10), pady=(10, 5))
 
@@ -1,16 +1,21 @@
 """A module for creating ProcessWindow class."""
 
-import queue
 import tkinter as tk
+from collections import deque
 
 from gui.base import BaseWindow, WindowConfig
 from gui.process_window.process_frame import ProcessFrame
 
+# the log window keeps only this many last lines, older ones are dropped
+LOG_VIEW_MAX_LINES = 5000
+
 
 class ProcessWindow(BaseWindow):
     """A class for creating processing window."""
 
-    def __init__(self, title, window_size, row_weight, column_weight, theme_file):
+    def __init__(
+        self, title, window_size, row_weight, column_weight, theme_file, master=None
+    ):
         """
         Window configuration parameters inherited from the BaseWindow base class.
 
@@ -20,10 +25,23 @@ class ProcessWindow(BaseWindow):
             row_weight (int): Weight for row grid resizing. Default is 1.
             column_weight (int): Weight for column grid resizing. Default is 1.
             theme_file (str): Path to a theme file for styling the window. Default is None.
+            master (tk.Tk, optional): The main window if this window is its child.
         """
-        config = WindowConfig(title, window_size, row_weight, column_weight, theme_file)
+        config = WindowConfig(
+            title, window_size, row_weight, column_weight, theme_file, master
+        )
         super().__init__(config)
+        # Closing only hides the window, so it can be reused for the next run
+        self.window.protocol("WM_DELETE_WINDOW", self.window.withdraw)
         self.process_frame = ProcessFrame(self.window)
+        self._log_widget = None
+        self._update_job = None
+        self._update_cb = None  # Tcl command name of the registered update callback
+        self._controller = None
+        self._empty_ticks = 0  # number of updates in a row without new messages
+        # messages not shown yet because the user scrolled back; every message takes
+        # at least one line, so older ones would be trimmed from the window anyway
+        self._pending = deque(maxlen=LOG_VIEW_MAX_LINES)
 
     def show(self):
         """
@@ -33,23 +51,69 @@ class ProcessWindow(BaseWindow):
         self.window.columnconfigure(0, weight=1)
         self.window.rowconfigure(0, weight=1)
         self.process_frame.build()
+        # the text widget lives as long as the window, so resolve it only once
+        self._log_widget = self.process_frame.log_window.widget
+        # register the update callback in Tcl once instead of on every after() call
+        self._update_cb = self._log_widget.register(self._poll_log_queue)
 
     def get_log_window(self):
         """
         Returns:
             An instance of a text field widget for displaying logs.
         """
-        return self.process_frame.log_window.widget
+        return self._log_widget
+
+    def reset(self):
+        """Stops log updates of the previous run and clears the log window."""
+        log_window = self._log_widget
+        if self._update_job is not None:
+            # after_cancel() would also delete the registered callback command
+            log_window.tk.call("after", "cancel", self._update_job)
+            self._update_job = None
+        self._empty_ticks = 0
+        self._pending.clear()
+        log_window.configure(state="normal")
+        log_window.delete("1.0", tk.END)
+        log_window.configure(state="disabled")
 
     def update_log_window(self, controller):
-        """Updates log window in recursion mode."""
-        log_window = self.get_log_window()  # get log window at every call
+        """Starts updating the log window with messages of the given controller."""
+        self._controller = controller
+        self._poll_log_queue()
+
+    def _poll_log_queue(self):
+        """Moves new messages to the log window and schedules the next poll."""
+        log_window = self._log_widget
+        log_queue = self._controller.log_queue
+        messages = []
         try:
             while True:
-                # takes messages from queue if any
-                message = controller.log_queue.get_nowait()
-                log_window.insert(tk.END, message + "\n\n")
-                log_window.see(tk.END)  # autoscroll
-        except queue.Empty:
+                # takes messages from queue if any; popleft() is thread-safe on a deque
+                messages.append(log_queue.popleft())
+        except IndexError:
             pass
-        log_window.after(100, self.update_log_window, controller)  # recursion
+        pending = self._pending
+        pending.extend(messages)
+        # while the user scrolls back to read, hold new messages instead of moving the view
+        if pending and log_window.yview()[1] >= 1.0:
+            # the widget is read-only, writable only for this batch
+            log_window.configure(state="normal")
+            # one insert for all new messages instead of one per message
+            log_window.insert(tk.END, "\n\n".join(pending) + "\n\n")
+            # drop the oldest lines, so inserts don't slow down as the log grows
+            line_count = int(log_window.index("end-1c").split(".")[0])
+            if line_count > LOG_VIEW_MAX_LINES:
+                log_window.delete("1.0", f"{line_count - LOG_VIEW_MAX_LINES}.0")
+            log_window.configure(state="disabled")
+            log_window.see(tk.END)  # autoscroll
+            pending.clear()
+        if messages:
+            # poll often while messages keep coming
+            delay = 30
+            self._empty_ticks = 0
+        else:
+            # back off up to 500 ms while the queue stays empty
+            delay = min(500, 100 * (1 + self._empty_ticks))
+            self._empty_ticks += 1
+        # reuses the same Tcl command, so no new callback is created per poll
+        self._update_job = log_window.tk.call("after", delay, self._update_cb)
@@ -20,9 +20,23 @@ class ProcessFrame(BaseFrame):
         self.frame.grid(row=0, column=0, sticky="nsew")
         self.frame.rowconfigure(0, weight=1)
         self.frame.columnconfigure(0, weight=1)
+        # fixed size (the window's one), so inserts into the text don't resize the frame
+        self.frame.configure(width=500, height=500)
+        self.frame.grid_propagate(False)
         # Text field to enter keywords
         self.log_window = BaseText(self.frame)
-        self.log_window.widget.config(wrap="word", width=25)
+        # read-only view: no undo history and no primary selection export
+        self.log_window.widget.config(
+            wrap="word",
+            width=25,
+            height=25,
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
+            blockcursor=False,
+            exportselection=False,
+            state="disabled",  # enabled only while the window writes to it
+        )
         self.log_window.widget.grid(
             row=0, column=0, sticky="nsew", padx=(10, 0), pady=10
         )
@@ -9,7 +9,9 @@ from gui.result_window.result_frame import ResultFrame
 class ResultWindow(BaseWindow):
     """A class for creating resulting window."""
 
-    def __init__(self, title, window_size, row_weight, column_weight, theme_file):
+    def __init__(
+        self, title, window_size, row_weight, column_weight, theme_file, master=None
+    ):
         """
         Window configuration parameters inherited from the BaseWindow base class.
 
@@ -19,10 +21,22 @@ class ResultWindow(BaseWindow):
             row_weight (int): Weight for row grid resizing. Default is 1.
             column_weight (int): Weight for column grid resizing. Default is 1.
             theme_file (str, optional): Path to a theme file for styling the window. Default is None.
+            master (tk.Tk, optional): The main window if this window is its child.
         """
-        config = WindowConfig(title, window_size, row_weight, column_weight, theme_file)
+        config = WindowConfig(
+            title, window_size, row_weight, column_weight, theme_file, master
+        )
         super().__init__(config)
+        # Closing only hides the window, so it can be reused for the next run
+        self.window.protocol("WM_DELETE_WINDOW", self.window.withdraw)
         self.result_frame = ResultFrame(self.window)
+        self._result_widget = None
+        # Clusters currently shown and the text tags marking their lines
+        self._rendered_clusters = {}
+        self._cluster_tags = {}
+        self._tag_counter = 0
+        self._controller = None
+        self._update_pending = False
 
     def show(self):
         """
@@ -32,24 +46,107 @@ class ResultWindow(BaseWindow):
         self.window.columnconfigure(0, weight=1)
         self.window.rowconfigure(0, weight=1)
         self.result_frame.build()
+        # the text widget lives as long as the window, so resolve it only once
+        self._result_widget = self.result_frame.result_window.widget
 
     def get_result_window(self):
         """
         Returns:
             An instance of a text field widget for displaying logs.
         """
-        return self.result_frame.result_window.widget
+        return self._result_widget
 
     def update_result_window(self, controller):
-        """Updates result window."""
-        result_window = self.get_result_window()
+        """
+        Requests an update of the result window.
+
+        Requests made before Tk gets idle are merged into one update.
+        """
+        self._controller = controller
+        if not self._update_pending:
+            self._update_pending = True
+            self._result_widget.after_idle(self._flush_update)
 
-        result_window.delete("1.0", tk.END)
-        results = controller.print_result()
+    def _flush_update(self):
+        """
+        Shows the latest results of the controller.
+
+        Clusters are shown in the order of the results. If the shown clusters keep
+        their order, only the changed ones are rewritten and new ones are appended;
+        if nothing changed, the text widget is not touched at all.
+        """
+        self._update_pending = False
+        result_window = self._result_widget
+        results = {
+            name: tuple(items)
+            for name, items in (self._controller.print_result() or {}).items()
+        }
+        rendered = self._rendered_clusters
+        # dicts compare equal regardless of order, so compare the items in order
+        if list(results.items()) == list(rendered.items()):
+            return
 
-        for name, items in results.items():
-            result_window.insert(tk.END, f"\n{name} ({len(items)} phrases):\n")
-            for item in items:
-                result_window.insert(tk.END, f"  - {item}\n")
+        # the widget is read-only, writable only for this update
+        result_window.configure(state="normal")
+        if list(results)[: len(rendered)] == list(rendered):
+            # Same clusters in the same order, maybe more of them at the end:
+            # replace changed clusters in place
+            for name, items in rendered.items():
+                if results[name] == items:
+                    continue
+                old_tag = self._cluster_tags.pop(name)
+                block = self._format_cluster(name, results[name])
+                new_tag = self._new_cluster_tag(name)
+                result_window.insert(f"{old_tag}.first", block, new_tag)
+                result_window.delete(f"{old_tag}.first", f"{old_tag}.last")
+                result_window.tag_delete(old_tag)
+            new_names = list(results)[len(rendered) :]
+        else:
+            # Clusters were removed or reordered: rebuild so the order matches the results
+            result_window.delete("1.0", tk.END)
+            if self._cluster_tags:
+                result_window.tag_delete(*self._cluster_tags.values())
+            self._cluster_tags.clear()
+            new_names = list(results)
 
+        # Append new clusters with a single insert: "text tag text tag ..."
+        chunks = []
+        for name in new_names:
+            chunks.append(self._format_cluster(name, results[name]))
+            chunks.append(self._new_cluster_tag(name))
+        if chunks:
+            result_window.insert(tk.END, *chunks)
+        result_window.configure(state="disabled")
+
+        self._rendered_clusters = results
         result_window.see(tk.END)
+
+    def _new_cluster_tag(self, name):
+        """
+        Creates a unique text tag marking the lines of one cluster.
+
+        Args:
+            name (str): Cluster name.
+
+        Returns:
+            str: Tag name.
+        """
+        self._tag_counter += 1
+        self._cluster_tags[name] = f"cluster{self._tag_counter}"
+        return self._cluster_tags[name]
+
+    @staticmethod
+    def _format_cluster(name, items):
+        """
+        Formats one cluster as text.
+
+        Args:
+            name (str): Cluster name.
+            items (tuple): Phrases of the cluster.
+
+        Returns:
+            str: Cluster header followed by one line per phrase.
+        """
+        lines = [f"\n{name} ({len(items)} phrases):\n"]
+        lines.extend(f"  - {item}\n" for item in items)
+        return "".join(lines)